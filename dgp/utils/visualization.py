@@ -1,11 +1,25 @@
 # Copyright 2019 Toyota Research Institute.  All rights reserved.
 """Visualization tools for a variety of tasks"""
+import math
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 import numpy as np
 from matplotlib.cm import get_cmap
 
 import cv2
 from dgp.utils.camera import Camera
 
+# Numba is optional: when available, it is used to fuse hot NumPy loops
+# (e.g. the BEV point-cloud scatter) into single-pass compiled kernels.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit, prange = None, range
+
 COLOR_RED = (255, 0, 0)
 COLOR_GREEN = (0, 255, 0)
 COLOR_BLUE = (0, 0, 255)
@@ -13,6 +27,22 @@ COLOR_GRAY = (100, 100, 100)
 COLOR_DARKGRAY = (50, 50, 50)
 COLOR_WHITE = (255, 255, 255)
 
+# 256-entry uint8 'jet' lookup table computed once at import time. Indexing
+# into this replaces per-call matplotlib colormap evaluation, which allocates
+# full-length float64 RGBA arrays.
+_JET_LUT = (get_cmap('jet')(np.linspace(0., 1., 256))[:, :3] * 255).astype(np.uint8)
+
+# Minimum number of tiles before mosaic() spreads its resizes over a thread
+# pool; below this the pool overhead outweighs the parallelism.
+_MOSAIC_PARALLEL_MIN_ITEMS = 8
+
+# Reusable uint8 5x5 kernel for dilating rendered points, instead of
+# allocating a float64 np.ones kernel per call.
+_DILATE_KERNEL_5x5 = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+
+# Height of the status bar drawn by print_status, in pixels.
+_STATUS_BAR_HEIGHT = 40
+
 class InstanceColorGenerator:
     """A Class that generates unique color based on instance category.
 
@@ -137,14 +167,40 @@ def print_status(image, text):
         Image with status printed
     """
     H, W = image.shape[:2]
-    status_xmax = int(W)
-    status_ymin = H - 40
-    text_offset = int(5 * 1)
-    cv2.rectangle(image, (0, status_ymin), (status_xmax, H), COLOR_DARKGRAY, thickness=-1)
-    cv2.putText(image, '%s' % text, (text_offset, H - text_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLOR_WHITE, thickness=1)
+    # Clip the bar against the top of the image, as the direct draws did
+    bar_height = min(H, _STATUS_BAR_HEIGHT)
+    image[H - bar_height:H] = _make_status_bar(W, '%s' % text)[-bar_height:]
     return image
 
 
+@lru_cache(maxsize=64)
+def _make_status_bar(width, text):
+    """Render a status bar strip with the provided text.
+
+    Cached on (width, text) so that visualization loops with a static status
+    rasterize the text only once per distinct message.
+
+    Parameters
+    ----------
+    width: int
+        Width of the status bar in pixels.
+
+    text: str
+        Text to be printed.
+
+    Returns
+    -------
+    bar: np.uint8 array
+        Rendered status bar, shape (_STATUS_BAR_HEIGHT, width, 3)
+    """
+    text_offset = int(5 * 1)
+    bar = np.empty((_STATUS_BAR_HEIGHT, width, 3), dtype=np.uint8)
+    bar[:] = COLOR_DARKGRAY
+    cv2.putText(bar, text, (text_offset, _STATUS_BAR_HEIGHT - text_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLOR_WHITE,
+                thickness=1)
+    return bar
+
+
 def mosaic(items, scale=1.0, pad=3, grid_width=None):
     """Creates a mosaic from list of images.
 
@@ -170,19 +226,51 @@ def mosaic(items, scale=1.0, pad=3, grid_width=None):
     # Determine tile width and height
     N = len(items)
     assert N > 0, 'No items to mosaic!'
-    grid_width = grid_width if grid_width else np.ceil(np.sqrt(N)).astype(int)
-    grid_height = np.ceil(N * 1. / grid_width).astype(np.int)
+    grid_width = grid_width if grid_width else int(math.ceil(math.sqrt(N)))
+    grid_height = -(-N // grid_width)
     input_size = items[0].shape[:2]
+
+    # Fast path: when no scaling is requested and all tiles already share a
+    # shape, write each tile directly into a preallocated canvas instead of
+    # going through resize, per-tile padding and hstack/vstack temporaries.
+    if scale == 1.0 and all(im.shape == items[0].shape for im in items):
+        tile_height, tile_width = input_size[0] + 2 * pad, input_size[1] + 2 * pad
+        canvas = np.zeros((grid_height * tile_height, grid_width * tile_width) + items[0].shape[2:], dtype=np.uint8)
+        for idx, im in enumerate(items):
+            y = (idx // grid_width) * tile_height + pad
+            x = (idx % grid_width) * tile_width + pad
+            canvas[y:y + input_size[0], x:x + input_size[1]] = im
+        return canvas
+
     target_shape = (int(input_size[1] * scale), int(input_size[0] * scale))
-    mosaic_items = []
-    for j in range(grid_width * grid_height):
-        if j < N:
-            # Only the first image is scaled, the rest are re-shaped
-            # to the same size as the previous image in the mosaic
-            im = cv2.resize(items[j], dsize=target_shape)
-            mosaic_items.append(im)
-        else:
-            mosaic_items.append(np.zeros_like(mosaic_items[-1]))
+
+    # All images are re-shaped to the scaled size of the first image in the
+    # mosaic. For power-of-two scales OpenCV's pyramid ops hit specialized
+    # SIMD paths, so prefer those whenever they land on the target shape.
+    def _resize(im):
+        height, width = im.shape[:2]
+        if (width, height) == target_shape:
+            return im
+        if scale == 0.5 and ((width + 1) // 2, (height + 1) // 2) == target_shape:
+            return cv2.pyrDown(im)
+        if scale == 2.0 and (2 * width, 2 * height) == target_shape:
+            return cv2.pyrUp(im)
+        return cv2.resize(im, dsize=target_shape)
+
+    # cv2.resize/pyrDown/pyrUp release the GIL, so for larger mosaics the
+    # resizes are spread over a thread pool.
+    if N >= _MOSAIC_PARALLEL_MIN_ITEMS:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            mosaic_items = list(executor.map(_resize, items))
+    else:
+        mosaic_items = [_resize(im) for im in items]
+
+    # Fill the remaining grid cells with a single shared empty tile; the
+    # padding and stacking below only read the tiles, so the aliasing is safe
+    n_empty = grid_width * grid_height - N
+    if n_empty > 0:
+        empty_tile = np.zeros_like(mosaic_items[-1])
+        mosaic_items.extend([empty_tile] * n_empty)
 
     # Stack W tiles horizontally first, then vertically
     im_pad = lambda im: cv2.copyMakeBorder(im, pad, pad, pad, pad, cv2.BORDER_CONSTANT, 0)
@@ -193,6 +281,63 @@ def mosaic(items, scale=1.0, pad=3, grid_width=None):
     return mosaic
 
 
+def mosaic_stream(items_iterable, n_workers=None, scale=1.0, pad=3, grid_width=None, chunksize=8):
+    """Stream mosaics for a sequence of frames using a process pool.
+
+    Dataset-scale visualization jobs emit thousands of independent mosaics;
+    building them on worker processes sidesteps the GIL for the Python-level
+    assembly work while preserving frame order.
+
+    Parameters
+    ----------
+    items_iterable: iterable of list of np.ndarray
+        Per-frame lists of images, each as accepted by `mosaic`.
+
+    n_workers: int, default: None
+        Number of worker processes. None uses the machine's CPU count.
+
+    scale: float, default=1.0
+        Scale factor applied to images. scale > 1.0 enlarges images.
+
+    pad: int, default=3
+        Padding size of the images before mosaic
+
+    grid_width: int, default=None
+        Mosaic width or grid width of the mosaic
+
+    chunksize: int, default: 8
+        Number of frames dispatched to a worker at a time.
+
+    Yields
+    ------
+    image: np.array of shape (H, W, 3)
+        Image mosaic for each frame, in input order.
+    """
+    build_mosaic = partial(mosaic, scale=scale, pad=pad, grid_width=grid_width)
+    with multiprocessing.Pool(n_workers) as pool:
+        for image in pool.imap(build_mosaic, items_iterable, chunksize=chunksize):
+            yield image
+
+
+def mosaic_to_preview_bytes(img):
+    """Encode a mosaic (or any BGR image) to PPM bytes for live preview.
+
+    PPM is a raw pixel format, so encoding skips the CPU-heavy PNG deflate
+    pass; prefer it over PNG when streaming frames to interactive viewers.
+
+    Parameters
+    ----------
+    img: np.array of shape (H, W, 3)
+        Image to encode.
+
+    Returns
+    -------
+    data: bytes
+        PPM-encoded image.
+    """
+    return cv2.imencode('.ppm', img)[1].tobytes()
+
+
 def render_bbox2d_on_image(img, bboxes2d, colors=None, texts=None):
     """Render list of bounding box2d on image.
 
@@ -215,24 +360,37 @@ def render_bbox2d_on_image(img, bboxes2d, colors=None, texts=None):
     img: np.array
         Image with rendered bounding boxes.
     """
-    boxes = [
-        np.int32([[bbox2d[0], bbox2d[1]], [bbox2d[0] + bbox2d[2], bbox2d[1]],
-                  [bbox2d[0] + bbox2d[2], bbox2d[1] + bbox2d[3]], [bbox2d[0], bbox2d[1] + bbox2d[3]]])
-        for bbox2d in bboxes2d
-    ]
+    if not len(bboxes2d):
+        return img
+
+    # Compute all box corners in a single (N, 4, 2) array instead of
+    # constructing one 4x2 array per box in Python.
+    bboxes2d = np.asarray(bboxes2d, dtype=np.int32).reshape(-1, 4)
+    x0, y0, w, h = bboxes2d[:, 0], bboxes2d[:, 1], bboxes2d[:, 2], bboxes2d[:, 3]
+    corners = np.stack([
+        np.stack([x0, y0], axis=1),
+        np.stack([x0 + w, y0], axis=1),
+        np.stack([x0 + w, y0 + h], axis=1),
+        np.stack([x0, y0 + h], axis=1)
+    ], axis=1)
+    boxes = list(corners)
     if colors is None:
         cv2.polylines(img, boxes, True, COLOR_RED, thickness=2)
     else:
         assert len(boxes) == len(colors), 'len(boxes) != len(colors)'
-        for idx, box in enumerate(boxes):
-            cv2.polylines(img, [box], True, colors[idx], thickness=2)
+        # Group boxes of like color into a single polylines call per color
+        color_to_indices = defaultdict(list)
+        for idx, box_color in enumerate(colors):
+            color_to_indices[tuple(box_color)].append(idx)
+        for box_color, indices in color_to_indices.items():
+            cv2.polylines(img, [boxes[idx] for idx in indices], True, box_color, thickness=2)
 
     # Add texts
     if texts:
         assert len(boxes) == len(texts), 'len(boxes) != len(texts)'
+        font = cv2.FONT_HERSHEY_SIMPLEX
         for idx, box in enumerate(boxes):
-            cv2.putText(img, texts[idx], tuple(box[0]), cv2.FONT_HERSHEY_SIMPLEX, 1,
-                        COLOR_WHITE, 2, cv2.LINE_AA)
+            cv2.putText(img, texts[idx], tuple(box[0]), font, 1, COLOR_WHITE, 2, cv2.LINE_AA)
     return img
 
 
@@ -261,29 +419,179 @@ def render_pointcloud_on_image(img, camera, Xw, colormap='jet', percentile=80):
     img: np.array
         Image with rendered point cloud.
     """
-    cmap = get_cmap('jet')
     # Move point cloud to the camera's (C) reference frame from the world (W)
     Xc = camera.p_cw * Xw
-    # Project the points as if they were in the camera's frame of reference
-    uv = Camera(K=camera.K).project(Xc)
-    # Colorize the point cloud based on depth
+    # Project the points as if they were in the camera's frame of reference.
+    # For skew-free intrinsics (the usual case) apply the pinhole model
+    # directly instead of constructing a throwaway Camera per call.
+    if camera.K[0, 1] == 0:
+        uvw = Xc.dot(camera.K.T)
+        uv = uvw[:, :2] / uvw[:, 2:]
+    else:
+        uv = Camera(K=camera.K).project(Xc)
+    # Colorize the point cloud based on depth, via a uint8 LUT gather
     z_c = Xc[:, 2]
     zinv_c = 1. / (z_c + 1e-6)
     zinv_c /= np.percentile(zinv_c, percentile)
-    colors = (cmap(np.clip(zinv_c, 0., 1.0))[:, :3] * 255).astype(np.uint8)
+    # cv2.LUT dispatches to a SIMD-accelerated gather, unlike generic NumPy
+    # fancy-indexing; it needs a 3-channel uint8 index image to look up a
+    # 3-channel table
+    idx = np.clip((zinv_c * 255.).astype(np.int32), 0, 255).astype(np.uint8).reshape(-1, 1)
+    colors = cv2.LUT(cv2.merge([idx, idx, idx]), _JET_LUT.reshape(1, 256, 3)).reshape(-1, 3)
 
     # Create an empty image to overlay
     H, W, _ = img.shape
     vis = np.zeros_like(img)
-    in_view = np.logical_and.reduce([(uv >= 0).all(axis=1), uv[:, 0] < W, uv[:, 1] < H, z_c > 0])
-    uv, colors = uv[in_view].astype(int), colors[in_view]
+    in_view = (uv[:, 0] >= 0) & (uv[:, 1] >= 0) & (uv[:, 0] < W) & (uv[:, 1] < H) & (z_c > 0)
+    # int32 indices behave identically for the scatter below but halve the
+    # cache footprint of the index arrays compared to int64
+    uv, colors = uv[in_view].astype(np.int32), colors[in_view]
+    vis[uv[:, 1], uv[:, 0]] = colors
+
+    # Dilate visualization so that they render clearly
+    vis = cv2.dilate(vis, _DILATE_KERNEL_5x5)
+    return np.maximum(vis, img)
+
+
+def render_pointcloud_on_image_cuda(img, camera, Xw, colormap='jet', percentile=80):
+    """Render pointcloud on image on the GPU via CuPy.
+
+    CUDA variant of `render_pointcloud_on_image` for multi-million point
+    LiDAR sweeps, where the CPU pipeline is memory-bandwidth bound. The
+    transform, projection, depth colorization and scatter all run on the
+    GPU; only the final overlay is downloaded. Requires the optional
+    `cupy` package; distortion coefficients are ignored, matching the
+    pinhole projection of the CPU path.
+
+    Parameters
+    ----------
+    img: np.ndarray
+        Image to render bounding boxes onto.
+
+    camera: Camera
+        Camera object with appropriately set extrinsics wrt world.
+
+    Xw: np.ndarray (N x 3)
+        3D point cloud (x, y, z) in the world coordinate.
+
+    colormap: str, default: jet
+        Colormap used for visualizing the inverse depth.
+
+    percentile: float, default: 80
+        Use this percentile to normalize the inverse depth.
+
+    Returns
+    -------
+    img: np.array
+        Image with rendered point cloud.
+    """
+    try:
+        import cupy as cp
+    except ImportError:
+        raise ImportError('render_pointcloud_on_image_cuda requires the optional cupy package')
+
+    # Move point cloud to the camera's (C) reference frame from the world (W)
+    T_cw = camera.p_cw.matrix
+    Xc = cp.asarray(Xw).dot(cp.asarray(T_cw[:3, :3].T)) + cp.asarray(T_cw[:3, 3])
+    # Project the points with the pinhole model
+    uvw = Xc.dot(cp.asarray(camera.K.T))
+    uv = uvw[:, :2] / uvw[:, 2:]
+    # Colorize the point cloud based on depth, via a uint8 LUT gather
+    z_c = Xc[:, 2]
+    zinv_c = 1. / (z_c + 1e-6)
+    zinv_c /= cp.percentile(zinv_c, percentile)
+    colors = cp.asarray(_JET_LUT)[cp.clip((zinv_c * 255.).astype(cp.int32), 0, 255)]
+
+    # Scatter into an empty GPU canvas and download the overlay
+    H, W, _ = img.shape
+    vis = cp.zeros((H, W, 3), dtype=cp.uint8)
+    in_view = (uv[:, 0] >= 0) & (uv[:, 1] >= 0) & (uv[:, 0] < W) & (uv[:, 1] < H) & (z_c > 0)
+    uv, colors = uv[in_view].astype(cp.int32), colors[in_view]
     vis[uv[:, 1], uv[:, 0]] = colors
+    vis = cp.asnumpy(vis)
 
     # Dilate visualization so that they render clearly
-    vis = cv2.dilate(vis, np.ones((5, 5)))
+    vis = cv2.dilate(vis, _DILATE_KERNEL_5x5)
     return np.maximum(vis, img)
 
 
+@lru_cache(maxsize=8)
+def _make_bev_template(metric_width, metric_height, pixels_per_meter, polar_step_size_meters):
+    """Create a blank BEV canvas with the metric polar grid drawn on it.
+
+    The result is cached on the constructor parameters so that pipelines
+    instantiating a BEVImage per frame pay for the anti-aliased circle
+    rasterization only once. Callers must copy the returned canvas before
+    drawing into it.
+
+    Parameters
+    ----------
+    metric_width: float
+        Metric extent of the view in width (X)
+
+    metric_height: float
+        Metric extent of the view in height (Y)
+
+    pixels_per_meter: float
+        Scale that expresses pixels per meter
+
+    polar_step_size_meters: int
+        Metric steps at which to draw the polar grid
+
+    Returns
+    -------
+    data: np.uint8 array
+        BEV canvas with the polar grid, shape (H, W, 3)
+    """
+    center_pixel = (int(metric_width * pixels_per_meter) // 2, int(metric_height * pixels_per_meter) // 2)
+    data = np.zeros((int(metric_height * pixels_per_meter), int(metric_width * pixels_per_meter), 3), dtype=np.uint8)
+
+    # Draw metric polar grid
+    for i in range(1, int(max(metric_width, metric_height)) // polar_step_size_meters):
+        cv2.circle(data, center_pixel, int(i * polar_step_size_meters * pixels_per_meter), (50, 50, 50), 1)
+    return data
+
+
+def _scatter_bev_points(point_cloud, data, center_x, center_y, pixels_per_meter, xaxis, yaxis):
+    """Scatter points onto a BEV canvas in a single fused pass.
+
+    Parameters
+    ----------
+    point_cloud: np.ndarray (N x 3+)
+        3D cloud points in the sensor coordinate frame.
+
+    data: np.ndarray (H x W x 3)
+        BEV canvas to write into.
+
+    center_x: int
+        X-coordinate of the canvas center pixel.
+
+    center_y: int
+        Y-coordinate of the canvas center pixel.
+
+    pixels_per_meter: float
+        Scale that expresses pixels per meter.
+
+    xaxis: int
+        Axis corresponding to the right of the BEV image.
+
+    yaxis: int
+        Axis corresponding to the forward of the BEV image.
+    """
+    H, W = data.shape[0], data.shape[1]
+    for i in prange(point_cloud.shape[0]):
+        u = center_x + point_cloud[i, xaxis] * pixels_per_meter
+        v = center_y - point_cloud[i, yaxis] * pixels_per_meter
+        if u >= 0 and v >= 0 and u < W and v < H:
+            data[int(v), int(u), 0] = 128
+            data[int(v), int(u), 1] = 128
+            data[int(v), int(u), 2] = 128
+
+
+if njit is not None:
+    _scatter_bev_points = njit(parallel=True, cache=True)(_scatter_bev_points)
+
+
 class BEVImage:
     """A class for bird's eye view visualization, which generates a canvas of bird's eye view image,
     This assumes that x-right, y-forward, so the projection will be in the first 2 coordinates 0, 1 (i.e. x-y plane)
@@ -318,14 +626,8 @@ class BEVImage:
         self._xaxis = xaxis
         self._yaxis = yaxis
         self._center_pixel = (int(metric_width * pixels_per_meter) // 2, int(metric_height * pixels_per_meter) // 2)
-        self.data = np.zeros((int(metric_height * pixels_per_meter), int(metric_width * pixels_per_meter), 3),
-                             dtype=np.uint8)
-
-        # Draw metric polar grid
-        for i in range(1, int(max(self._metric_width, self._metric_height)) // polar_step_size_meters):
-            cv2.circle(
-                self.data, self._center_pixel, int(i * polar_step_size_meters * self._pixels_per_meter), (50, 50, 50), 1
-            )
+        # Copy the cached polar-grid template instead of redrawing it
+        self.data = _make_bev_template(metric_width, metric_height, pixels_per_meter, polar_step_size_meters).copy()
 
     def __repr__(self):
         return 'width: {}, height: {}, data: {}'.format(self._metric_width, self._metric_height, type(self.data))
@@ -339,10 +641,21 @@ class BEVImage:
             3D cloud points in the sensor coordinate frame.
         """
 
-        # Draw point-cloud
-        point_cloud2d = np.vstack([point_cloud[:, self._xaxis], point_cloud[:, self._yaxis]]).T
-        point_cloud2d[:, 0] = self._center_pixel[0] + point_cloud2d[:, 0] * self._pixels_per_meter
-        point_cloud2d[:, 1] = self._center_pixel[1] - point_cloud2d[:, 1] * self._pixels_per_meter
+        # Draw point-cloud: with Numba available, project, bounds-check and
+        # scatter in a single compiled pass instead of several full-length
+        # NumPy temporaries.
+        if njit is not None:
+            _scatter_bev_points(
+                point_cloud, self.data, self._center_pixel[0], self._center_pixel[1], self._pixels_per_meter,
+                self._xaxis, self._yaxis
+            )
+            return
+
+        # Write both projected columns straight into the target buffer rather
+        # than stacking to (2, N) and transposing
+        point_cloud2d = np.empty((point_cloud.shape[0], 2), dtype=point_cloud.dtype)
+        point_cloud2d[:, 0] = self._center_pixel[0] + point_cloud[:, self._xaxis] * self._pixels_per_meter
+        point_cloud2d[:, 1] = self._center_pixel[1] - point_cloud[:, self._yaxis] * self._pixels_per_meter
         H, W = self.data.shape[:2]
         uv = point_cloud2d.astype(np.int32)
         in_view = np.logical_and.reduce([(point_cloud2d >= 0).all(axis=1), point_cloud2d[:, 0] < W, point_cloud2d[:, 1] < H])
@@ -360,6 +673,29 @@ class BEVImage:
         color: RGB tuple, default: None
             If provided, draw boxes using this color instead of red forward/blue back
 
+        texts: list of str, default: None
+            3D annotation category name.
+        """
+        if not len(bboxes3d):
+            return
+        self.render_bounding_box_3d_batch(np.stack([bbox.corners for bbox in bboxes3d]), color=color, texts=texts)
+
+    def render_bounding_box_3d_batch(self, corners, color=None, texts=None):
+        """Render a batch of 3D bounding boxes, given as corner coordinates,
+        in BEV perspective.
+
+        Compared to `render_bounding_box_3d`, this takes a single contiguous
+        corner array and avoids per-box Python object access entirely.
+
+        Parameters
+        ----------
+        corners: np.ndarray (N x 8 x 3)
+            Cuboid corners in the sensor coordinate frame, using the same
+            corner ordering as `BoundingBox3D.corners`.
+
+        color: RGB tuple, default: None
+            If provided, draw boxes using this color instead of red forward/blue back
+
         texts: list of str, default: None
             3D annotation category name.
         """
@@ -369,31 +705,43 @@ class BEVImage:
         else:
             colors = [color] * 4
 
-        # Draw cuboids
-        for bidx, bbox in enumerate(bboxes3d):
-            # Do orthogonal projection and bring into pixel coordinate space
-            corners = bbox.corners
-            corners2d = np.vstack([corners[:, self._xaxis], corners[:, self._yaxis]]).T
-
-            # Compute the center and offset of the corners
-            corners2d[:, 0] = self._center_pixel[0] + corners2d[:, 0] * self._pixels_per_meter
-            corners2d[:, 1] = self._center_pixel[1] - corners2d[:, 1] * self._pixels_per_meter
-            center = np.mean(corners2d, axis=0).astype(np.int32)
-            corners2d = corners2d.astype(np.int32)
-
-            # Draw object center and green line towards front face, unless color specified
-            cv2.circle(self.data, tuple(center), 1, COLOR_GREEN)
-            cv2.line(self.data, tuple(center), ((corners2d[0][0] + corners2d[1][0])//2, \
-                (corners2d[0][1] + corners2d[1][1]) // 2), COLOR_WHITE, 2)
-
-            # Draw front face, side faces and back face
-            cv2.line(self.data, tuple(corners2d[0]), tuple(corners2d[1]), colors[0], 2)
-            cv2.line(self.data, tuple(corners2d[3]), tuple(corners2d[4]), colors[3], 2)
-            cv2.line(self.data, tuple(corners2d[1]), tuple(corners2d[5]), colors[3], 2)
-            cv2.line(self.data, tuple(corners2d[4]), tuple(corners2d[5]), colors[2], 2)
-
-            if texts:
-                cv2.putText(self.data, texts[bidx], tuple(corners2d[0]), cv2.FONT_HERSHEY_SIMPLEX, 0.5,
+        corners = np.asarray(corners)
+        if not len(corners):
+            return
+
+        # Do orthogonal projection of all corners at once and bring them
+        # into pixel coordinate space, yielding (N, 8, 2) coordinates
+        center_x, center_y = self._center_pixel
+        pixels_per_meter = self._pixels_per_meter
+        corners2d = np.empty(corners.shape[:2] + (2, ))
+        np.multiply(corners[:, :, self._xaxis], pixels_per_meter, out=corners2d[:, :, 0])
+        np.multiply(corners[:, :, self._yaxis], -pixels_per_meter, out=corners2d[:, :, 1])
+        corners2d[:, :, 0] += center_x
+        corners2d[:, :, 1] += center_y
+        centers = np.mean(corners2d, axis=1).astype(np.int32)
+        corners2d = corners2d.astype(np.int32)
+
+        # Draw green object centers in a single scatter pass
+        H, W = self.data.shape[:2]
+        in_view = (centers[:, 0] >= 0) & (centers[:, 1] >= 0) & (centers[:, 0] < W) & (centers[:, 1] < H)
+        self.data[centers[in_view, 1], centers[in_view, 0]] = COLOR_GREEN
+
+        # Draw lines towards the front faces with a single polylines call
+        front_centers = (corners2d[:, 0] + corners2d[:, 1]) // 2
+        cv2.polylines(self.data, list(np.stack([centers, front_centers], axis=1)), False, COLOR_WHITE, 2)
+
+        # Draw front faces, side faces and back faces, batching the edges of
+        # like color into one polylines call each
+        edges_by_color = {}
+        for edge, edge_color in zip([(0, 1), (3, 4), (1, 5), (4, 5)], [colors[0], colors[3], colors[3], colors[2]]):
+            edges_by_color.setdefault(edge_color, []).append(edge)
+        for edge_color, edges in edges_by_color.items():
+            segments = np.ascontiguousarray(corners2d[:, edges].reshape(-1, 2, 2))
+            cv2.polylines(self.data, list(segments), False, edge_color, 2)
+
+        if texts:
+            for bidx, corners2d_i in enumerate(corners2d):
+                cv2.putText(self.data, texts[bidx], tuple(corners2d_i[0]), cv2.FONT_HERSHEY_SIMPLEX, 0.5,
                             COLOR_WHITE, 2, cv2.LINE_AA)
 
 